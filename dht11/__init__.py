@@ -14,8 +14,57 @@ Usage:
 
 
 import RPi.GPIO as GPIO
+import numpy as np
+import os
 import time
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# MARK: Decoder
+# SWAR constants for comparing eight 8-bit pulse widths packed in one uint64
+_SWAR_ONES: np.uint64 = np.uint64(0x0101010101010101)
+_SWAR_HIGH: np.uint64 = np.uint64(0x8080808080808080)
+_SWAR_GATHER: np.uint64 = np.uint64(0x8040201008040201)
+
+if njit is not None:
+    @njit(cache=True, boundscheck=False)
+    def _pulse_widths(samples: np.ndarray, preamble: int, bits: int) -> np.ndarray:
+        """
+        Compiled edge detection over the raw samples
+
+        Args:
+            samples (np.ndarray): input data (uint8)
+            preamble (int): number of edges before the first data bit
+            bits (int): number of high pulses to collect
+
+        Returns:
+            np.ndarray: widths of the high pulses after the preamble (fewer than bits if the frame is short)
+        """
+        widths = np.empty(bits, dtype=np.int64)
+        count = 0
+        edges = 0
+        rise = 0
+
+        for i in range(1, samples.size):
+            if samples[i] != samples[i - 1]:
+                if edges >= preamble:
+                    if samples[i]:
+                        rise = i
+                    else:
+                        widths[count] = i - rise
+                        count += 1
+                        if count == bits:
+                            break
+                edges += 1
+
+        return widths[:count]
+else:
+    _pulse_widths = None
+
 # MARK: Exceptions
 class DHT11Error(Exception):
     """
@@ -73,6 +122,9 @@ class DHT11Response:
         status (int): status code
         temperature (float): temperature value
         humidity (float): humidity value
+
+    Notes:
+        Responses are treated as immutable; the string form is built once and cached.
     """
     STATUS_OK: int = 0
     STATUS_ERROR_CHECKSUM: int = 1
@@ -86,6 +138,7 @@ class DHT11Response:
         self.status = status
         self.temperature = temperature
         self.humidity = humidity
+        self.__text: str | None = None
 
 
     def is_valid(self) -> bool:
@@ -93,10 +146,12 @@ class DHT11Response:
 
 
     def __str__(self) -> str:
-        return f"Response(status={self.status}, temperature={self.temperature}, humidity={self.humidity})"
+        text: str | None = self.__text
+        if text is None:
+            text = self.__text = f"Response(status={self.status}, temperature={self.temperature}, humidity={self.humidity})"
+        return text
 
-    def __repr__(self) -> str:
-        return self.__str__()
+    __repr__ = __str__
 
 
 # MARK: DHT11
@@ -107,143 +162,226 @@ class DHT11:
     Attributes:
         signal_pin (int): GPIO pin number (BCM) where the sensor is connected
         max_tries (int): maximum number of retries to read data
-        min_interval (int | float): minimum interval between reads in seconds
+        min_interval (int | float): minimum interval between successful reads in seconds
+        retry_interval (int | float): interval between failed attempts in seconds
         raise_error (bool): whether to raise an exception when an error occurs
 
+    Notes:
+        The sampling window runs under SCHED_FIFO on core REALTIME_CPU when the process
+        has root or CAP_SYS_NICE; otherwise the normal scheduler is used.
+
     """
     MIN_INTERVAL: int = 2
-
-    def __init__(self, signal_pin: int, max_tries: int = 10, min_interval: int | float = MIN_INTERVAL, raise_error: bool = False) -> None:
+    RETRY_INTERVAL: float = .05
+    SETTLE_TIME: int = 1
+    EDGES_PREAMBLE: int = 2
+    BITS_PER_READ: int = 40
+    MAX_SAMPLES: int = 20000
+    REALTIME_PRIORITY: int = 50
+    REALTIME_CPU: int = 3
+    THRESHOLD_WARMUP: int = 10
+
+    def __init__(self, signal_pin: int, max_tries: int = 10, min_interval: int | float = MIN_INTERVAL, raise_error: bool = False, retry_interval: int | float = RETRY_INTERVAL) -> None:
         self.signal_pin = signal_pin
         self.max_tries = max_tries
         self.min_interval = min_interval
+        self.retry_interval = retry_interval
+        self.raise_error = raise_error
+        self.__ready_at: float = time.monotonic() + DHT11.SETTLE_TIME
+        self.__buffer: bytearray = bytearray(DHT11.MAX_SAMPLES)
+        self.__threshold: float | None = None
+        self.__threshold_reads: int = 0
 
 
-    def __send_signal(self, signal: bool, timeout: int = 0) -> None:
+    def __enter_realtime(self) -> tuple | None:
+        """
+        Run the calling process with SCHED_FIFO priority pinned to a single core, so that the
+        sampling loop is not preempted while the sensor is transmitting
+
+        Changing the scheduling policy requires root or the CAP_SYS_NICE capability;
+        without it the process keeps its normal scheduling and is not pinned either.
+
+        Returns:
+            tuple | None: previous (policy, param, affinity) to restore, or None if unchanged
         """
-        Send a signal to the sensor
+        try:
+            state: tuple = (os.sched_getscheduler(0), os.sched_getparam(0), os.sched_getaffinity(0))
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(DHT11.REALTIME_PRIORITY))
+        except (AttributeError, OSError):
+            return None
+
+        try:
+            os.sched_setaffinity(0, {DHT11.REALTIME_CPU})
+        except OSError:
+            pass
+
+        return state
+
+
+    def __exit_realtime(self, state: tuple | None) -> None:
+        """
+        Restore the scheduling saved by __enter_realtime
 
         Args:
-            signal (bool): signal to send
-            timeout (int | float): time to wait after sending the signal
+            state (tuple | None): previous (policy, param, affinity)
 
         Returns:
             None
         """
-        GPIO.output(self.signal_pin, signal)
-        time.sleep(timeout)
+        if state is None:
+            return
+
+        policy, param, affinity = state
+        try:
+            os.sched_setscheduler(0, policy, param)
+        except OSError:
+            pass
+        try:
+            os.sched_setaffinity(0, affinity)
+        except OSError:
+            pass
 
 
-    def __collect_input(self) -> list[bool]:
+    def __collect_input(self) -> memoryview:
         """
         Collect input data from the sensor
 
+        Samples are written into a preallocated buffer, one byte per sample.
+
         Returns:
-            list[bool]: input data
+            memoryview: input data (view of the collected samples)
         """
         unchanged_count: int = 0
         unchanged_threshold: int = 200
         last: int = -1
-        data: list[bool] = []
+        data: bytearray = self.__buffer
+        i: int = 0
+
+        # bind to locals to avoid attribute lookups per sample
+        gpio_input = GPIO.input
+        pin: int = self.signal_pin
+        max_samples: int = DHT11.MAX_SAMPLES
 
-        GPIO.setup(self.signal_pin, GPIO.IN)
+        GPIO.setup(pin, GPIO.IN)
 
-        while unchanged_count < unchanged_threshold:
-            current: bool = GPIO.input(self.signal_pin)
-            data.append(current)
+        while unchanged_count < unchanged_threshold and i < max_samples:
+            current: int = gpio_input(pin)
+            data[i] = current
+            i += 1
 
             if last != current:
                 unchanged_count = 0
                 last = current
             unchanged_count += 1
 
-        return data
+        return memoryview(data)[:i]
 
 
-    def __parse_input_data(self, data: list[bool]) -> list[int]:
+    def __parse_input_data(self, data: memoryview) -> list[int] | None:
         """
         Parse input data from the sensor
 
+        The samples are first reduced to the positions of their edges, and
+        the high pulse widths are taken as the distance between each rising
+        edge and the following falling edge. When numba is available this is
+        done by a compiled loop, otherwise with NumPy.
+
         Args:
-            data (list[bool]): input data
+            data (memoryview): input data
 
         Returns:
-            list[int]: parsed signals
+            list[int] | None: parsed signals (BITS_PER_READ high pulse widths), or None if the data is shorter than a full frame
         """
-        signals: list[int] = []
-        input_length: int = len(data)
-        pattern: int = 0
-
-        # find the beginning of the data
-        for i in range(input_length):
-            if pattern == 0 and data[i] == GPIO.LOW:
-                pattern = 1
-            if pattern == 1 and data[i] == GPIO.HIGH:
-                pattern = 2
-            if pattern == 2 and data[i] == GPIO.LOW:
-                break
-        if i >= input_length:
-            return signals
-
-        high_signal_length: int = 0
-        for j in range(i, input_length):
-            if data[j] == GPIO.HIGH:
-                high_signal_length += 1
-            elif data[j] == GPIO.LOW:
-                if high_signal_length > 0:
-                    signals.append(high_signal_length)
-                    high_signal_length = 0
-
-        return signals
-
-
-    def __calculate_bits(self, signals: list[int]) -> list[int]:
+        samples: np.ndarray = np.frombuffer(data, dtype=np.uint8)
+
+        # find the beginning of the data (LOW -> HIGH -> LOW response)
+        start: int = 0 if samples.size and samples[0] == GPIO.LOW else 1
+        preamble: int = start + DHT11.EDGES_PREAMBLE
+        bits: int = DHT11.BITS_PER_READ
+        if _pulse_widths is not None:
+            widths: np.ndarray = _pulse_widths(samples, preamble, bits)
+            if widths.size < bits:
+                return None
+            return widths.tolist()
+
+        # a frame is exactly one rising and one falling edge per bit after the preamble
+        edges: np.ndarray = np.flatnonzero(np.diff(samples)) + 1
+        if edges.size < preamble + 2 * bits:
+            return None
+
+        data_edges: np.ndarray = edges[preamble:preamble + 2 * bits]
+        signals: np.ndarray = data_edges[1::2] - data_edges[0::2]
+
+        return signals.tolist()
+
+
+    def __pack_bits(self, signals: list[int], half_length: int) -> np.ndarray:
         """
-        Calculate bits from signals
+        Pack signals into bytes, one bit per signal (1 if longer than half_length)
 
         Args:
             signals (list[int]): signals
+            half_length (int): threshold between 0 and 1 pulses
 
         Returns:
-            list[int]: bytes
-
-        Notes:
-            bytes[0] - integral part of humidity  
-            bytes[1] - decimal part of humidity  
-            bytes[2] - integral part of temperature  
-            bytes[3] - decimal part of temperature  
-            bytes[4] - checksum  
+            np.ndarray: frame bytes (uint8)
         """
-        half_length: int = (min(signals) + max(signals)) / 2
-        bits = 0
+        # eight signals per uint64 lane word, one byte each
+        lanes: np.ndarray = np.minimum(signals, 0xFF).astype(np.uint8).view("<u8")
+        broadcast: np.uint64 = np.uint64(min(half_length, 0xFF)) * _SWAR_ONES
 
-        for signal in signals:
-            bits <<= 1
-            if signal > half_length:
-                bits |= 1
+        # per-byte (signal > half_length) in the high bit of each byte, without carries between bytes
+        low: np.ndarray = (broadcast | _SWAR_HIGH) - (lanes & ~_SWAR_HIGH)
+        mask: np.ndarray = ((~broadcast & lanes) | (~(broadcast ^ lanes) & ~low)) & _SWAR_HIGH
 
-        bytes: list[int] = [
-            (bits >> 32) & 0xFF,
-            (bits >> 24) & 0xFF,
-            (bits >> 16) & 0xFF,
-            (bits >>  8) & 0xFF,
-            (bits      ) & 0xFF
-        ]
+        # gather the eight high bits into one byte, first signal as the MSB
+        return (((mask >> np.uint64(7)) * _SWAR_GATHER) >> np.uint64(56)).astype(np.uint8)
 
-        return bytes
 
-
-    def __validate_checksum(self, bytes: list[int]) -> bool:
+    def __calculate_bits(self, signals: list[int]) -> np.ndarray:
         """
-        Validate checksum
+        Calculate bits from signals
+
+        The threshold between 0 and 1 pulses is the midpoint of the shortest and
+        longest signal, smoothed over the first THRESHOLD_WARMUP successful reads
+        and then reused without rescanning the signals. A reused threshold that
+        decodes every bit the same no longer separates short and long pulses
+        (e.g. the sampling rate changed), so the frame is decoded again with its
+        own midpoint and the threshold is recalibrated.
 
         Args:
-            bytes (list[int]): bytes
+            signals (list[int]): signals
 
         Returns:
-            bool: True if the checksum is valid, False otherwise
+            np.ndarray: frame bytes (uint8)
+
+        Notes:
+            frame[0] - integral part of humidity  
+            frame[1] - decimal part of humidity  
+            frame[2] - integral part of temperature  
+            frame[3] - decimal part of temperature  
+            frame[4] - checksum  
         """
-        return bytes[4] == (bytes[0] + bytes[1] + bytes[2] + bytes[3]) & 0xFF
+        midpoint: float | None = self.__threshold
+        if midpoint is None:
+            midpoint = (min(signals) + max(signals)) / 2
+            self.__threshold_reads = 0
+            self.__threshold = midpoint
+
+            # signals are integers, so comparing against the floor is equivalent
+            return self.__pack_bits(signals, int(midpoint))
+
+        if self.__threshold_reads < DHT11.THRESHOLD_WARMUP:
+            midpoint = .9 * midpoint + .1 * (min(signals) + max(signals)) / 2
+            self.__threshold = midpoint
+
+        frame: np.ndarray = self.__pack_bits(signals, int(midpoint))
+        if frame.any() and not (frame == 0xFF).all():
+            return frame
+
+        # stale threshold, fall back to this frame's own midpoint
+        self.__threshold = None
+        return self.__calculate_bits(signals)
 
 
     # MARK: Public methods
@@ -255,9 +393,7 @@ class DHT11:
             DHT11Response: Response.
 
         Raises:
-            DHT11TimeoutError: If the maximum number of retries is reached.
-            DHT11InvalidDataError: If the data is invalid.
-            DHT11ChecksumError: If the checksum is invalid.
+            DHT11TimeoutError: If the maximum number of retries is reached and raise_error is set.
 
         Examples:
             >>> sensor = DHT11(signal_pin=26)
@@ -269,40 +405,100 @@ class DHT11:
         """
         try_count: int = 0
 
-        while self.max_tries > try_count:
-            try:
-                GPIO.setup(self.signal_pin, GPIO.OUT, initial=GPIO.HIGH)
-                time.sleep(.5)
+        # bind to locals to avoid attribute lookups per attempt
+        pin: int = self.signal_pin
+        max_tries: int = self.max_tries
+        raise_error: bool = self.raise_error
+        output = GPIO.output
+        sleep = time.sleep
+        HIGH: int = GPIO.HIGH
+        LOW: int = GPIO.LOW
+
+        # wait until the sensor has settled after power-up or the last successful read
+        wait: float = self.__ready_at - time.monotonic()
+        if wait > 0:
+            sleep(wait)
 
+        while max_tries > try_count:
+            GPIO.setup(pin, GPIO.OUT, initial=HIGH)
+
+            realtime_state: tuple | None = self.__enter_realtime()
+            try:
                 # initial signal
-                self.__send_signal(GPIO.HIGH, .05) # HIGH 50ms
-                self.__send_signal(GPIO.LOW, .02) # LOW 20ms
+                output(pin, HIGH)
+                sleep(.05) # HIGH 50ms
+                output(pin, LOW)
+                sleep(.02) # LOW 20ms
 
                 # wait for sensor response
-                input_data: list[bool] = self.__collect_input()
-                signals: list[int] = self.__parse_input_data(input_data)
+                input_data: memoryview = self.__collect_input()
+            finally:
+                self.__exit_realtime(realtime_state)
 
-                if len(signals) != 40:
-                    raise DHT11InvalidDataError
+            signals: list[int] | None = self.__parse_input_data(input_data)
 
-                bytes: list[int] = self.__calculate_bits(signals)
+            if signals is not None:
+                frame: np.ndarray = self.__calculate_bits(signals)
 
-                if not self.__validate_checksum(bytes):
-                    raise DHT11ChecksumError
+                # validate checksum on the payload as one big-endian uint32.
+                # The bytes are summed with shifts and adds: the multiply form
+                # ((payload * 0x01010101) >> 24) & 0xFF is no faster on ARMv8 and
+                # lets carries from the lower partial sums leak into the result.
+                payload: int = int.from_bytes(frame[:4].tobytes(), "big")
+                checksum: int = (payload & 0xFF) + ((payload >>  8) & 0xFF) \
+                              + ((payload >> 16) & 0xFF) + ((payload >> 24) & 0xFF)
 
-                humidity = bytes[0] + bytes[1] / 10
-                temperature = bytes[2] + (bytes[3] & 0x7F) / 10
+                if checksum & 0xFF == int(frame[4]):
+                    humidity = ((payload >> 24) & 0xFF) + ((payload >> 16) & 0xFF) / 10
+                    temperature = ((payload >> 8) & 0xFF) + (payload & 0x7F) / 10
 
-                if bytes[3] & 0x80:
-                    temperature *= -1
+                    if payload & 0x80:
+                        temperature *= -1
 
-                status = DHT11Response.STATUS_OK
-                return DHT11Response(status, temperature, humidity)
+                    self.__threshold_reads += 1
+                    self.__ready_at = time.monotonic() + self.min_interval
+                    status = DHT11Response.STATUS_OK
+                    return DHT11Response(status, temperature, humidity)
 
-            except DHT11Error as e:
-                try_count += 1
-                time.sleep(self.min_interval)
+            # invalid data or checksum error, recalibrate the threshold on the next frame
+            self.__threshold = None
+            try_count += 1
+            sleep(self.retry_interval)
 
-        if self.raise_error:
+        if raise_error:
             raise DHT11TimeoutError
         return DHT11Response(DHT11Response.STATUS_ERROR_TIMEOUT)
+
+
+    def read_many(self, n: int, interval: int | float = MIN_INTERVAL) -> list[DHT11Response]:
+        """
+        Read data from the sensor n times at a fixed interval.
+
+        Reads are scheduled on a monotonic clock, so the time spent reading is
+        not added to the interval. The interval is never shorter than min_interval
+        after a successful read.
+
+        Args:
+            n (int): number of reads
+            interval (int | float): interval between the starts of consecutive reads in seconds
+
+        Returns:
+            list[DHT11Response]: Responses, in the order they were read.
+
+        Raises:
+            DHT11TimeoutError: If the maximum number of retries is reached and raise_error is set.
+
+        Examples:
+            >>> sensor = DHT11(signal_pin=26)
+            >>> for response in sensor.read_many(5):  
+            >>>     print(response)  
+        """
+        responses: list[DHT11Response] = []
+        next_at: float = max(self.__ready_at, time.monotonic())
+
+        for _ in range(n):
+            self.__ready_at = max(self.__ready_at, next_at)
+            responses.append(self.read())
+            next_at += interval
+
+        return responses